@@ -0,0 +1,132 @@
+import time
+from collections.abc import Mapping
+
+from pymongo import InsertOne, ReplaceOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import BulkWriteError
+
+from shared.logger import get_logger
+
+logger = get_logger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class MongoBatcher:
+    """Buffers article documents and flushes them to MongoDB as unordered bulk writes."""
+
+    def __init__(self, collection: AsyncCollection, batch_size: int, flush_interval: float) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            collection: Articles collection to write to
+            batch_size: Number of buffered documents that triggers a flush
+            flush_interval: Maximum seconds a buffered document may wait before a flush
+        """
+        self.collection = collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list[Mapping[str, object]] = []
+        # Monotonic time the oldest buffered document was added
+        self._oldest_added = 0.0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add(self, document: Mapping[str, object]) -> None:
+        """
+        Buffer an article document for the next flush.
+
+        Args:
+            document: Complete article document, keyed by ``_id``
+        """
+        if not self._buffer:
+            self._oldest_added = time.monotonic()
+
+        self._buffer.append(document)
+
+    @property
+    def should_flush(self) -> bool:
+        """Whether the buffer is full or its oldest document has waited long enough."""
+        if not self._buffer:
+            return False
+
+        return (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._oldest_added >= self.flush_interval
+        )
+
+    async def flush(self) -> None:
+        """
+        Write all buffered documents in a single unordered bulk write.
+
+        Documents are inserted rather than upserted, which spares the server a
+        lookup for the common case of a new article. Documents whose ``_id``
+        already exists (e.g. a task replayed from the DLQ) are then replaced
+        in a second bulk write. If a bulk write fails as a whole (e.g.
+        connection loss), the documents are put back so the next flush
+        retries them.
+        """
+        if not self._buffer:
+            return
+
+        oldest_added = self._oldest_added
+        documents, self._buffer = self._buffer, []
+
+        try:
+            duplicates = await self._write(documents, [InsertOne(doc) for doc in documents])
+
+            if duplicates:
+                duplicates = await self._write(
+                    duplicates,
+                    [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in duplicates],
+                )
+
+        except Exception:
+            # Re-running the inserts is safe: existing documents fall back to a replace
+            self._buffer[:0] = documents
+            self._oldest_added = oldest_added
+            raise
+
+        for document in duplicates:
+            logger.warning("duplicate_article", article_id=document["_id"])
+
+        logger.info("articles_flushed", count=len(documents))
+
+    async def _write(
+        self,
+        documents: list[Mapping[str, object]],
+        operations: list[InsertOne | ReplaceOne],
+    ) -> list[Mapping[str, object]]:
+        """
+        Run one unordered bulk write and sort out its per-document errors.
+
+        Args:
+            documents: Documents the operations write, in the same order
+            operations: Write operations to run
+
+        Returns:
+            Documents whose write failed with a duplicate key error
+        """
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+
+        except BulkWriteError as error:
+            duplicates = []
+
+            for write_error in error.details.get("writeErrors", []):
+                document = documents[write_error["index"]]
+
+                if write_error.get("code") == DUPLICATE_KEY_ERROR:
+                    duplicates.append(document)
+                else:
+                    logger.error(
+                        "mongodb_store_error",
+                        article_id=document["_id"],
+                        error=write_error.get("errmsg"),
+                    )
+
+            return duplicates
+
+        return []
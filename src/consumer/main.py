@@ -1,22 +1,47 @@
-import json
+import asyncio
 import signal
 import sys
 import time
+from collections.abc import Coroutine
 from datetime import datetime, timezone
 
 import httpx
-from pymongo import MongoClient
-from pymongo.errors import DuplicateKeyError
-from redis import Redis
+import msgspec
+import orjson
+from pymongo import AsyncMongoClient, WriteConcern
+from redis.asyncio import Redis
 
+from consumer.batcher import MongoBatcher
 from consumer.scraper import ArticleScraper
 from shared.config import get_settings
-from shared.database import ensure_indexes
+from shared.database import ensure_indexes, get_database_name
 from shared.logger import configure_logging, get_logger
-from shared.models import ArticleDocument, ArticleTask, ScrapedContent
+from shared.models import ArticleTask, ScrapedContent
 
 logger = get_logger(__name__)
 
+# Settings and derived values are resolved once instead of on every task
+_SETTINGS = get_settings()
+_DB_NAME = get_database_name()
+
+# Moves retries whose backoff has elapsed from the retry set back onto the
+# main queue atomically. KEYS: retry set, queue. ARGV: now, max items.
+PROMOTE_DUE_RETRIES = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #due > 0 then
+    redis.call('ZREM', KEYS[1], unpack(due))
+    redis.call('RPUSH', KEYS[2], unpack(due))
+end
+return #due
+"""
+
+# Webhook deliveries in flight. References are held here so pending tasks are
+# not garbage collected, and so shutdown can wait for them to finish.
+_WEBHOOK_TASKS: set[asyncio.Task[None]] = set()
+
+# Upper bound on concurrent webhook deliveries
+_WEBHOOK_CONCURRENCY = asyncio.Semaphore(4)
+
 # Global flag for graceful shutdown
 shutdown_flag: bool = False
 
@@ -28,55 +53,64 @@ def signal_handler(signum: int, _frame: object) -> None:
     logger.info("shutdown_signal_received", signal=signum, shutdown_flag=shutdown_flag)
 
 
-def get_redis_client() -> Redis:
+async def get_redis_client() -> Redis:
     """
     Create and return Redis client connection.
 
     Returns:
         Connected Redis client
     """
-    settings = get_settings()
-
     client = Redis(
-        host=settings.redis_host,
-        port=settings.redis_port,
-        db=settings.redis_db,
+        host=_SETTINGS.redis_host,
+        port=_SETTINGS.redis_port,
+        db=_SETTINGS.redis_db,
         decode_responses=True,
+        socket_keepalive=True,
+        health_check_interval=30,
     )
 
-    client.ping()
+    await client.ping()
 
     logger.info(
         "redis_connected",
-        host=settings.redis_host,
-        port=settings.redis_port,
+        host=_SETTINGS.redis_host,
+        port=_SETTINGS.redis_port,
     )
 
     return client
 
 
-def get_mongo_client() -> MongoClient:
+async def get_mongo_client() -> AsyncMongoClient:
     """
     Create and return MongoDB client connection.
 
+    The connection pool is kept warm at a fixed size matched to the consumer's
+    concurrency, and writes are acknowledged by the primary without waiting
+    for the journal or for replication to a majority.
+
     Returns:
         Connected MongoDB client
     """
-    settings = get_settings()
-
-    client = MongoClient(settings.mongodb_uri)
+    client = AsyncMongoClient(
+        _SETTINGS.mongodb_uri,
+        maxPoolSize=_SETTINGS.mongo_pool_size,
+        minPoolSize=_SETTINGS.mongo_pool_size,
+        w=1,
+        journal=False,
+        compressors="zstd",
+        retryWrites=True,
+    )
 
     # Test connection
-    client.admin.command("ping")
+    await client.admin.command("ping")
 
-    # Extract database name from URI
-    db_name = settings.mongodb_uri.split("/")[-1].split("?")[0]
-    logger.info("mongodb_connected", database=db_name)
+    logger.info("mongodb_connected", database=_DB_NAME)
 
     return client
 
 
-def send_discord_webhook(
+async def send_discord_webhook(
+    http_client: httpx.AsyncClient,
     webhook_url: str,
     article_task: ArticleTask,
     success: bool,
@@ -88,6 +122,7 @@ def send_discord_webhook(
     Send notification to Discord webhook.
 
     Args:
+        http_client: Shared HTTP client used for webhook delivery
         webhook_url: Discord webhook URL
         article_task: Original article task
         success: Whether scraping succeeded
@@ -95,6 +130,8 @@ def send_discord_webhook(
         error_message: Error message if failed
         attempts: Number of attempts made
     """
+    now_iso = datetime.now(timezone.utc).isoformat()
+
     try:
         if success and scraped_content:
             embed = {
@@ -105,14 +142,14 @@ def send_discord_webhook(
                     {"name": "Source", "value": article_task.source, "inline": True},
                     {"name": "Category", "value": article_task.category, "inline": True},
                     {"name": "Title", "value": scraped_content.title, "inline": False},
-                    {"name": "URL", "value": str(article_task.url), "inline": False},
+                    {"name": "URL", "value": article_task.url, "inline": False},
                     {
                         "name": "HTTP Status",
                         "value": str(scraped_content.http_status),
                         "inline": True,
                     },
                 ],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": now_iso,
             }
         else:
             embed = {
@@ -122,27 +159,27 @@ def send_discord_webhook(
                     {"name": "Article ID", "value": article_task.id, "inline": True},
                     {"name": "Source", "value": article_task.source, "inline": True},
                     {"name": "Attempts", "value": str(attempts), "inline": True},
-                    {"name": "URL", "value": str(article_task.url), "inline": False},
+                    {"name": "URL", "value": article_task.url, "inline": False},
                     {
                         "name": "Error",
                         "value": error_message or "Unknown error",
                         "inline": False,
                     },
                 ],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": now_iso,
             }
 
-        payload = {"embeds": [embed]}
+        payload = orjson.dumps({"embeds": [embed]})
 
-        with httpx.Client(timeout=10) as client:
-            response = client.post(webhook_url, json=payload)
-            response.raise_for_status()
-
-        logger.info(
-            "discord_webhook_sent",
-            article_id=article_task.id,
-            success=success,
+        response = await http_client.post(
+            webhook_url,
+            content=payload,
+            headers={"Content-Type": "application/json"},
         )
+        response.raise_for_status()
+
+        if _SETTINGS.verbose:
+            logger.info("discord_webhook_sent", article_id=article_task.id, success=success)
 
     except Exception as exception:
         logger.error(
@@ -152,8 +189,27 @@ def send_discord_webhook(
         )
 
 
-def store_article(
-    mongo_client: MongoClient,
+def dispatch_discord_webhook(delivery: Coroutine[None, None, None]) -> None:
+    """
+    Send a Discord webhook in the background without blocking the caller.
+
+    Delivery errors are logged by ``send_discord_webhook`` itself.
+
+    Args:
+        delivery: Pending ``send_discord_webhook`` call to run
+    """
+
+    async def deliver() -> None:
+        async with _WEBHOOK_CONCURRENCY:
+            await delivery
+
+    task = asyncio.create_task(deliver())
+    _WEBHOOK_TASKS.add(task)
+    task.add_done_callback(_WEBHOOK_TASKS.discard)
+
+
+async def store_article(
+    batcher: MongoBatcher,
     article_task: ArticleTask,
     scraped_content: ScrapedContent | None = None,
     status: str = "success",
@@ -163,54 +219,58 @@ def store_article(
     """
     Store article data in MongoDB.
 
+    Successful articles are buffered in the batcher and written with the next
+    bulk flush. Failure markers are written immediately without waiting for
+    acknowledgement, since they are not critical to durability, and only if
+    no document exists yet so they never overwrite a stored article.
+
     Args:
-        mongo_client: MongoDB client
+        batcher: Batcher buffering writes to the articles collection
         article_task: Original article task
         scraped_content: Scraped content if available
         status: Processing status
         attempts: Number of attempts made
         error_message: Error message if failed
     """
-    settings = get_settings()
-    db_name = settings.mongodb_uri.split("/")[-1].split("?")[0]
-    db = mongo_client[db_name]
-    collection = db["articles"]
-
-    # Build document
-    article_doc = ArticleDocument(
-        _id=article_task.id,
-        url=str(article_task.url),
-        source=article_task.source,
-        category=article_task.category,
-        priority=article_task.priority,
-        status=status,
-        attempts=attempts,
-        error_message=error_message,
-        title=scraped_content.title if scraped_content else None,
-        meta_description=scraped_content.meta_description if scraped_content else None,
-        author=scraped_content.author if scraped_content else None,
-        published_date=scraped_content.published_date if scraped_content else None,
-        http_status=scraped_content.http_status if scraped_content else None,
-        scraped_at=scraped_content.scraped_at if scraped_content else None,
-    )
-
-    try:
-        # Insert or update
-        collection.replace_one(
-            {"_id": article_task.id},
-            article_doc.model_dump(by_alias=True, exclude_none=True),
-            upsert=True,
+    # Build document directly from the already validated task and content,
+    # leaving out fields that are not set
+    document: dict[str, object] = {
+        "_id": article_task.id,
+        "url": article_task.url,
+        "source": article_task.source,
+        "category": article_task.category,
+        "priority": article_task.priority,
+        "status": status,
+        "attempts": attempts,
+    }
+
+    if scraped_content is not None:
+        document.update(
+            (field, value)
+            for field in ScrapedContent.__struct_fields__
+            if (value := getattr(scraped_content, field)) is not None
         )
 
-        logger.info(
-            "article_stored",
-            article_id=article_task.id,
-            status=status,
-            attempts=attempts,
-        )
+    if error_message is not None:
+        document["error_message"] = error_message
+
+    try:
+        if status == "failed":
+            collection = batcher.collection.with_options(write_concern=WriteConcern(w=0))
+            del document["_id"]
+            await collection.update_one(
+                {"_id": article_task.id}, {"$setOnInsert": document}, upsert=True
+            )
+        else:
+            batcher.add(document)
 
-    except DuplicateKeyError:
-        logger.warning("duplicate_article", article_id=article_task.id)
+        if _SETTINGS.verbose:
+            logger.info(
+                "article_stored",
+                article_id=article_task.id,
+                status=status,
+                attempts=attempts,
+            )
 
     except Exception as exception:
         logger.error(
@@ -221,172 +281,222 @@ def store_article(
         raise
 
 
-def process_task(
+async def process_task(
     redis_client: Redis,
-    mongo_client: MongoClient,
+    batcher: MongoBatcher,
     scraper: ArticleScraper,
+    http_client: httpx.AsyncClient,
     task_data: str,
     webhook_url: str,
-) -> None:
+) -> bytes | None:
     """
-    Process a single article task with retry logic.
+    Process a single delivery of an article task.
+
+    Each delivery makes one scrape attempt. On failure the task is scheduled
+    for another attempt in the retry set with exponential backoff instead of
+    sleeping, so the consumer keeps draining the queue in the meantime.
 
     Args:
         redis_client: Redis client
-        mongo_client: MongoDB client
+        batcher: Batcher buffering writes to the articles collection
         scraper: Article scraper instance
+        http_client: Shared HTTP client used for webhook delivery
         task_data: JSON string of article task
         webhook_url: Discord webhook URL
-    """
-    settings = get_settings()
 
+    Returns:
+        Task payload to move to the dead letter queue if all retries are
+        exhausted, otherwise None
+    """
     # Parse task
-    task_dict = json.loads(task_data)
-    article_task = ArticleTask(**task_dict)
+    article_task = msgspec.json.decode(task_data, type=ArticleTask)
+    attempt = article_task.attempt
 
-    logger.info(
-        "task_processing_started",
-        article_id=article_task.id,
-        url=str(article_task.url),
-    )
+    # Task context is bound once and carried by every log line below
+    log = logger.bind(article_id=article_task.id, url=article_task.url, attempt=attempt)
 
-    attempt = 1
-    last_error = None
+    if _SETTINGS.verbose:
+        log.info("task_processing_started")
 
-    while attempt <= settings.max_retries:
-        try:
-            # Scrape article
-            scraped_content = scraper.scrape(
-                url=str(article_task.url),
-                article_id=article_task.id,
-            )
+    try:
+        # Scrape article
+        scraped_content = await scraper.scrape(
+            url=article_task.url,
+            article_id=article_task.id,
+        )
 
-            # Store in MongoDB
-            store_article(
-                mongo_client=mongo_client,
-                article_task=article_task,
-                scraped_content=scraped_content,
-                status="success",
-                attempts=attempt,
-            )
+        # Store in MongoDB
+        await store_article(
+            batcher=batcher,
+            article_task=article_task,
+            scraped_content=scraped_content,
+            status="success",
+            attempts=attempt,
+        )
 
-            # Send success webhook
+        # Send success webhook
+        dispatch_discord_webhook(
             send_discord_webhook(
+                http_client=http_client,
                 webhook_url=webhook_url,
                 article_task=article_task,
                 success=True,
                 scraped_content=scraped_content,
                 attempts=attempt,
             )
+        )
 
-            logger.info(
-                "task_processing_complete",
-                article_id=article_task.id,
-                attempts=attempt,
-            )
+        log.info("task_processing_complete")
 
-            return
+        return None
 
-        except Exception as exception:
-            last_error = str(exception)
+    except Exception as exception:
+        last_error = str(exception)
 
-            logger.warning(
-                "task_processing_failed",
-                article_id=article_task.id,
-                attempt=attempt,
-                max_retries=settings.max_retries,
-                error=last_error,
-            )
+        log.warning(
+            "task_processing_failed",
+            max_retries=_SETTINGS.max_retries,
+            error=last_error,
+        )
 
-            if attempt < settings.max_retries:
-                # Calculate exponential backoff
-                backoff_time = settings.retry_backoff_base * (2 ** (attempt - 1))
-                logger.info(
-                    "retry_scheduled",
-                    article_id=article_task.id,
-                    next_attempt=attempt + 1,
-                    backoff_seconds=backoff_time,
-                )
-                time.sleep(backoff_time)
-
-            attempt += 1
-
-    # All retries exhausted - move to DLQ and store failure
-    logger.error(
-        "task_failed_all_retries",
-        article_id=article_task.id,
-        attempts=attempt - 1,
-        error=last_error,
-    )
+    if attempt < _SETTINGS.max_retries:
+        # Calculate exponential backoff and schedule the next attempt
+        backoff_time = _SETTINGS.retry_backoff_base * (2 ** (attempt - 1))
+        retry_data = msgspec.json.encode(msgspec.structs.replace(article_task, attempt=attempt + 1))
+
+        await redis_client.zadd(
+            _SETTINGS.retry_queue_name, {retry_data: time.time() + backoff_time}
+        )
+
+        log.info("retry_scheduled", next_attempt=attempt + 1, backoff_seconds=backoff_time)
+
+        return None
+
+    # All retries exhausted - store failure, the caller moves it to the DLQ
+    log.error("task_failed_all_retries", error=last_error)
 
     # Store failed status in MongoDB
-    store_article(
-        mongo_client=mongo_client,
+    await store_article(
+        batcher=batcher,
         article_task=article_task,
         scraped_content=None,
         status="failed",
-        attempts=attempt - 1,
+        attempts=attempt,
         error_message=last_error,
     )
 
     # Send failure webhook
-    send_discord_webhook(
-        webhook_url=webhook_url,
-        article_task=article_task,
-        success=False,
-        error_message=last_error,
-        attempts=attempt - 1,
+    dispatch_discord_webhook(
+        send_discord_webhook(
+            http_client=http_client,
+            webhook_url=webhook_url,
+            article_task=article_task,
+            success=False,
+            error_message=last_error,
+            attempts=attempt,
+        )
     )
 
-    # Move to dead letter queue
-    redis_client.lpush(settings.dlq_name, task_data)
-    logger.info("task_moved_to_dlq", article_id=article_task.id, dlq=settings.dlq_name)
+    # Reset the attempt counter so a task replayed from the DLQ gets full retries
+    return msgspec.json.encode(msgspec.structs.replace(article_task, attempt=1))
 
 
-def consume_tasks() -> None:
-    """Main consumer loop - continuously processes tasks from Redis queue."""
-    global shutdown_flag
+async def consume_tasks() -> None:
+    """
+    Main consumer loop - continuously processes tasks from Redis queue.
 
-    settings = get_settings()
+    Tasks are popped in batches of up to ``batch_size`` with BLMPOP and
+    processed concurrently (at most ``max_concurrency`` at a time), so the
+    consumer keeps working while individual HTTP fetches are in flight.
+    """
+    global shutdown_flag
 
     # Initialize connections
-    redis_client = get_redis_client()
-    mongo_client = get_mongo_client()
+    redis_client = await get_redis_client()
+    mongo_client = await get_mongo_client()
     scraper = ArticleScraper()
+    http_client = httpx.AsyncClient(timeout=10)
+    webhook_url = str(_SETTINGS.discord_webhook_url)
+    semaphore = asyncio.Semaphore(_SETTINGS.max_concurrency)
+    batcher = MongoBatcher(
+        mongo_client[_DB_NAME]["articles"],
+        batch_size=_SETTINGS.mongo_batch_size,
+        flush_interval=_SETTINGS.mongo_flush_interval,
+    )
 
     # Ensure MongoDB indexes exist
-    ensure_indexes(mongo_client)
+    await ensure_indexes(mongo_client)
 
     logger.info(
         "consumer_started",
-        queue=settings.queue_name,
-        max_retries=settings.max_retries,
+        queue=_SETTINGS.queue_name,
+        max_retries=_SETTINGS.max_retries,
+        batch_size=_SETTINGS.batch_size,
+        max_concurrency=_SETTINGS.max_concurrency,
     )
 
+    promote_due_retries = redis_client.register_script(PROMOTE_DUE_RETRIES)
+
+    async def run_task(task_data: str) -> bytes | None:
+        async with semaphore:
+            return await process_task(
+                redis_client=redis_client,
+                batcher=batcher,
+                scraper=scraper,
+                http_client=http_client,
+                task_data=task_data,
+                webhook_url=webhook_url,
+            )
+
     while not shutdown_flag:
         try:
-            # Block and wait for task (timeout 1 second for responsiveness)
-            result = redis_client.brpop([settings.queue_name], timeout=1)
+            # Requeue retries whose backoff has elapsed
+            await promote_due_retries(
+                keys=[_SETTINGS.retry_queue_name, _SETTINGS.queue_name],
+                args=[time.time(), _SETTINGS.batch_size],
+            )
+
+            # Block and wait for a batch of tasks (timeout 1 second for responsiveness)
+            result = await redis_client.blmpop(
+                1,
+                1,
+                _SETTINGS.queue_name,
+                direction="LEFT",
+                count=_SETTINGS.batch_size,
+            )
 
             if result is None:
+                # Queue is idle - don't leave buffered writes waiting
+                await batcher.flush()
                 continue
 
-            if isinstance(result, (list, tuple)):
-                # Extract task data
-                _, task_data = result
+            _, batch = result
+
+            results = await asyncio.gather(
+                *(run_task(task_data) for task_data in batch),
+                return_exceptions=True,
+            )
+
+            dead_letters = []
+
+            for outcome in results:
+                if isinstance(outcome, bytes):
+                    dead_letters.append(outcome)
+
+                elif isinstance(outcome, Exception):
+                    logger.error(
+                        "consumer_loop_error",
+                        error=str(outcome),
+                        error_type=type(outcome).__name__,
+                    )
 
-                # Process the task
-                process_task(
-                    redis_client=redis_client,
-                    mongo_client=mongo_client,
-                    scraper=scraper,
-                    task_data=task_data,
-                    webhook_url=str(settings.discord_webhook_url),
-                )
+            # Move all failed tasks of the batch to the dead letter queue at once
+            if dead_letters:
+                await redis_client.rpush(_SETTINGS.dlq_name, *dead_letters)
+                logger.info("tasks_moved_to_dlq", count=len(dead_letters), dlq=_SETTINGS.dlq_name)
 
-        except KeyboardInterrupt:
-            logger.info("keyboard_interrupt_received")
-            break
+            if batcher.should_flush:
+                await batcher.flush()
 
         except Exception as exception:
             logger.error(
@@ -395,11 +505,24 @@ def consume_tasks() -> None:
                 error_type=type(exception).__name__,
             )
 
-            time.sleep(1)
+            await asyncio.sleep(1)
 
     logger.info("consumer_shutting_down")
-    mongo_client.close()
-    redis_client.close()
+
+    # A failed final flush must not skip the webhook drain and connection cleanup
+    try:
+        await batcher.flush()
+    except Exception as exception:
+        logger.error("mongodb_store_error", count=len(batcher), error=str(exception))
+
+    # Let webhook deliveries still in flight finish before closing their client
+    if _WEBHOOK_TASKS:
+        await asyncio.gather(*_WEBHOOK_TASKS, return_exceptions=True)
+
+    await scraper.close()
+    await http_client.aclose()
+    await mongo_client.close()
+    await redis_client.aclose()
 
 
 def main() -> None:
@@ -411,7 +534,7 @@ def main() -> None:
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        consume_tasks()
+        asyncio.run(consume_tasks())
     except Exception as exception:
         logger.error("consumer_fatal_error", error=str(exception))
         sys.exit(1)
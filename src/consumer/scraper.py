@@ -1,14 +1,109 @@
+import codecs
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
+from html import unescape
+from typing import Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 from httpx import HTTPStatusError, RequestError
+from lxml import etree, html
 
+from shared.config import get_settings
 from shared.logger import get_logger
 from shared.models import ScrapedContent
 
 logger = get_logger(__name__)
 
+# Per-scrape progress logs are only emitted in verbose mode
+_VERBOSE = get_settings().verbose
+
+# Size of the response chunks fed to the HTML parser
+_STREAM_CHUNK_SIZE = 65536
+
+# Bytes read looking for </head> before the regex head scan gives up
+_HEAD_SCAN_LIMIT = 32768
+
+_RE_HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+_RE_META_TAG = re.compile(rb"<meta\b[^>]*>", re.IGNORECASE)
+_RE_ATTRIBUTE = re.compile(rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+# Charset declared by <meta charset> or <meta http-equiv="Content-Type" content="...">
+_RE_META_CHARSET = re.compile(rb"""<meta\b[^>]*?charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+
+# Encoding assumed when neither the response nor the document declares one
+_DEFAULT_ENCODING = "utf-8"
+
+
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching elements that carry the given CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath expressions are compiled once at import and reused for every scrape.
+# Each returns the normalized string value of its first match ("" if none).
+_XP_META = etree.XPath("//meta[@content]")
+_XP_TITLE = (
+    etree.XPath("normalize-space(//h1)"),
+    etree.XPath("normalize-space(//title)"),
+)
+_XP_AUTHOR = (
+    etree.XPath(
+        "normalize-space("
+        f"//*[{_has_class('author')} or {_has_class('author-name')}"
+        " or @itemprop='author' or @rel='author'])"
+    ),
+)
+_XP_PUBLISHED_DATE = (
+    etree.XPath("normalize-space(//time/@datetime)"),
+    etree.XPath(
+        "normalize-space("
+        f"//*[{_has_class('published')} or {_has_class('date')}"
+        f" or {_has_class('post-date')} or @itemprop='datePublished'])"
+    ),
+)
+
+# Meta keys consulted for each field, in priority order
+_TITLE_META = ("og:title", "twitter:title")
+_DESCRIPTION_META = ("description", "og:description")
+_AUTHOR_META = ("author", "article:author")
+_PUBLISHED_DATE_META = ("article:published_time",)
+_ALL_FIELDS_META = (_TITLE_META, _DESCRIPTION_META, _AUTHOR_META, _PUBLISHED_DATE_META)
+
+# Every meta key any field reads; all other meta tags are skipped while collecting
+_META_KEYS = frozenset(key for keys in _ALL_FIELDS_META for key in keys)
+
+
+@lru_cache(maxsize=64)
+def _resolve_encoding(name: str) -> str | None:
+    """
+    Map a declared charset to a name both Python and libxml2 understand.
+
+    The two disagree on some aliases (e.g. libxml2 rejects ``latin-1`` but
+    accepts ``iso8859-1``), so the declared name is tried before Python's
+    canonical one.
+
+    Args:
+        name: Lowercased charset name as declared by the server or document
+
+    Returns:
+        Usable encoding name, or None if the charset is unknown
+    """
+    try:
+        canonical = codecs.lookup(name).name
+    except LookupError:
+        return None
+
+    for candidate in (name, canonical):
+        try:
+            html.HTMLParser(encoding=candidate)
+        except LookupError:
+            continue
+
+        return candidate
+
+    return None
+
 
 class ArticleScraper:
     """Scraper for extracting article content from web pages."""
@@ -17,6 +112,11 @@ class ArticleScraper:
         """
         Initialize the article scraper.
 
+        A single HTTP client is shared across scrapes so connections, TLS
+        sessions and HTTP/2 state are reused instead of rebuilt per URL.
+        Brotli-compressed responses are requested where servers support them,
+        and failed connection attempts are retried once by the transport.
+
         Args:
             timeout: Request timeout in seconds
         """
@@ -26,22 +126,37 @@ class ArticleScraper:
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
-            )
+            ),
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "br, gzip, deflate",
         }
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers=self.headers,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            ),
+        )
 
-    def _get_clean_attr(self, tag: Tag, attr: str) -> str | None:
-        """Helper to handle BeautifulSoup multi-valued attributes and stripping."""
+        # Idle HTML parsers ready for reuse, pooled per document encoding. A
+        # parser is fed incrementally across awaits, so each in-flight scrape
+        # needs its own.
+        self._parsers: dict[str, list[html.HTMLParser]] = {}
 
-        val = tag.get(attr)
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        await self._client.aclose()
 
-        if val is None:
-            return None
-        if isinstance(val, list):
-            return " ".join(val).strip()
+    async def __aenter__(self) -> Self:
+        return self
 
-        return str(val).strip()
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
 
-    def scrape(self, url: str, article_id: str) -> ScrapedContent:
+    async def scrape(self, url: str, article_id: str) -> ScrapedContent:
         """
         Scrape article content from a given URL.
 
@@ -56,29 +171,72 @@ class ArticleScraper:
             HTTPError: If request fails
             Exception: If parsing fails
         """
-        logger.info("scraping_started", article_id=article_id, url=url)
+        if _VERBOSE:
+            logger.info("scraping_started", article_id=article_id, url=url)
 
         try:
-            # Make HTTP request
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, headers=self.headers, follow_redirects=True)
+            async with self._client.stream("GET", url) as response:
                 response.raise_for_status()
 
-            logger.info(
-                "http_request_success",
-                article_id=article_id,
-                status_code=response.status_code,
-                content_length=len(response.content),
-            )
-
-            # Parse HTML
-            soup = BeautifulSoup(response.content, "lxml")
+                chunks = response.aiter_bytes(_STREAM_CHUNK_SIZE)
+                head = b""
+
+                # Read only as far as </head> first
+                async for chunk in chunks:
+                    head += chunk
+                    if len(head) >= _HEAD_SCAN_LIMIT or _RE_HEAD_END.search(head):
+                        break
+
+                # A single chunk can run well past </head>; the regex scans stop
+                # at it, or at the scan limit if it isn't found in time
+                head_end = _RE_HEAD_END.search(head, 0, _HEAD_SCAN_LIMIT)
+                scanned = head[: head_end.end() if head_end else _HEAD_SCAN_LIMIT]
+
+                content_length = len(head)
+                encoding = self._detect_encoding(response, scanned)
+                meta = self._scan_head_meta(scanned, encoding)
+                root = None
+
+                # Fall back to a full parse only when the head meta tags don't
+                # cover every field. The rest of the body is streamed into the
+                # parser chunk by chunk, so parsing overlaps with the download.
+                if not all(any(key in meta for key in keys) for keys in _ALL_FIELDS_META):
+                    parser = self._acquire_parser(encoding)
+                    parser.feed(head)
+
+                    async for chunk in chunks:
+                        parser.feed(chunk)
+                        content_length += len(chunk)
+
+                    # An empty, whitespace-only or comment-only body has no
+                    # root element; it is scraped as an empty document
+                    try:
+                        root = parser.close()
+                    except etree.XMLSyntaxError:
+                        # Drop the parser rather than reuse it in a failed state
+                        root = None
+                    else:
+                        self._parsers[encoding].append(parser)
+
+                    meta = self._collect_meta(root) if root is not None else {}
+
+            if _VERBOSE:
+                logger.info(
+                    "http_request_success",
+                    article_id=article_id,
+                    status_code=response.status_code,
+                    content_length=content_length,
+                )
 
             # Extract content
-            title = self._extract_title(soup, article_id)
-            meta_description = self._extract_meta_description(soup, article_id)
-            author = self._extract_author(soup, article_id)
-            published_date = self._extract_published_date(soup, article_id)
+            title = self._first_match(root, meta, _TITLE_META, _XP_TITLE)
+            meta_description = self._first_match(root, meta, _DESCRIPTION_META)
+            author = self._first_match(root, meta, _AUTHOR_META, _XP_AUTHOR)
+            published_date = self._first_match(root, meta, _PUBLISHED_DATE_META, _XP_PUBLISHED_DATE)
+
+            if title is None:
+                logger.warning("title_not_found", article_id=article_id)
+                title = "Untitled"
 
             scraped_content = ScrapedContent(
                 title=title,
@@ -89,13 +247,14 @@ class ArticleScraper:
                 scraped_at=datetime.now(timezone.utc),
             )
 
-            logger.info(
-                "scraping_complete",
-                article_id=article_id,
-                title=title,
-                has_description=meta_description is not None,
-                has_author=author is not None,
-            )
+            if _VERBOSE:
+                logger.info(
+                    "scraping_complete",
+                    article_id=article_id,
+                    title=title,
+                    has_description=meta_description is not None,
+                    has_author=author is not None,
+                )
 
             return scraped_content
 
@@ -121,182 +280,136 @@ class ArticleScraper:
             )
             raise
 
-    def _extract_title(self, soup: BeautifulSoup, article_id: str) -> str:
+    def _detect_encoding(self, response: httpx.Response, head: bytes) -> str:
         """
-        Extract article title from HTML.
+        Choose the character encoding the document is decoded with.
 
-        Tries multiple strategies:
-        1. <meta property="og:title">
-        2. <meta name="twitter:title">
-        3. <h1> tag
-        4. <title> tag
+        A charset in the Content-Type header takes precedence over one
+        declared by a <meta> tag in the head. Unknown charsets are ignored.
 
         Args:
-            soup: BeautifulSoup parsed HTML
-            article_id: Article ID for logging
+            response: Response whose headers are checked
+            head: Leading bytes of the document
 
         Returns:
-            Extracted title or "Untitled" if not found
+            Encoding name usable by both Python and lxml
         """
-        # Try Open Graph title
-        og_title = soup.find("meta", property="og:title")
-        if isinstance(og_title, Tag):
-            title = self._get_clean_attr(og_title, "content")
+        match = _RE_META_CHARSET.search(head)
+        meta_charset = match[1].decode("ascii") if match else None
 
-            if title:
-                return title
+        for declared in (response.charset_encoding, meta_charset):
+            if declared and (encoding := _resolve_encoding(declared.strip().lower())):
+                return encoding
 
-        # Try Twitter title
-        twitter_title = soup.find("meta", attrs={"name": "twitter:title"})
-        if twitter_title and twitter_title.get("content"):
-            title = self._get_clean_attr(twitter_title, "content")
+        return _DEFAULT_ENCODING
 
-            if title:
-                return title
+    def _acquire_parser(self, encoding: str) -> html.HTMLParser:
+        """
+        Take an idle HTML parser for the encoding from the pool, creating one if none is free.
 
-        # Try h1 tag
-        h1 = soup.find("h1")
-        if h1:
-            return h1.get_text(strip=True)
+        Parsers skip comments, processing instructions and ID collection,
+        none of which the extraction reads.
 
-        # Fallback to title tag
-        title_tag = soup.find("title")
-        if title_tag:
-            return title_tag.get_text(strip=True)
+        Args:
+            encoding: Encoding the document is decoded with
 
-        logger.warning("title_not_found", article_id=article_id)
+        Returns:
+            HTML parser ready to be fed; return it to ``_parsers[encoding]`` once closed
+        """
+        pool = self._parsers.setdefault(encoding, [])
+        if pool:
+            return pool.pop()
 
-        return "Untitled"
+        return html.HTMLParser(
+            encoding=encoding, remove_comments=True, remove_pis=True, collect_ids=False
+        )
 
-    def _extract_meta_description(self, soup: BeautifulSoup, article_id: str) -> str | None:
+    def _collect_meta(self, root: html.HtmlElement) -> dict[str, str]:
         """
-        Extract meta description from HTML.
-
-        Tries:
-        1. <meta name="description">
-        2. <meta property="og:description">
+        Collect relevant <meta> tag contents in a single pass over the document.
 
         Args:
-            soup: BeautifulSoup parsed HTML
-            article_id: Article ID for logging
+            root: Parsed HTML document
 
         Returns:
-            Meta description or None if not found
+            Mapping of lowercased ``property``/``name`` in ``_META_KEYS`` to the
+            first non-empty content
         """
-        # Try standard meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            desc = self._get_clean_attr(meta_desc, "content")
+        meta: dict[str, str] = {}
 
-            if desc:
-                return desc
+        for node in _XP_META(root):
+            key = (node.get("property") or node.get("name") or "").lower()
 
-        # Try Open Graph description
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            desc = self._get_clean_attr(og_desc, "content")
+            if key not in _META_KEYS or key in meta:
+                continue
 
-            if desc:
-                return desc
+            content = node.get("content", "").strip()
+            if content:
+                meta[key] = content
 
-        logger.debug("meta_description_not_found", article_id=article_id)
+        return meta
 
-        return None
-
-    def _extract_author(self, soup: BeautifulSoup, article_id: str) -> str | None:
+    def _scan_head_meta(self, head: bytes, encoding: str) -> dict[str, str]:
         """
-        Extract author from HTML.
-
-        Tries:
-        1. <meta name="author">
-        2. <meta property="article:author">
-        3. Common author class/id patterns
+        Collect <meta> tag contents from the raw document head with regexes.
 
         Args:
-            soup: BeautifulSoup parsed HTML
-            article_id: Article ID for logging
+            head: Leading bytes of the document, up to and including </head>
+            encoding: Encoding the document is decoded with
 
         Returns:
-            Author name or None if not found
+            Mapping of lowercased ``property``/``name`` in ``_META_KEYS`` to the
+            first non-empty content
         """
-        # Try meta author tag
-        meta_author = soup.find("meta", attrs={"name": "author"})
-        if meta_author and meta_author.get("content"):
-            author = self._get_clean_attr(meta_author, "content")
-
-            if author:
-                return author
-
-        # Try article:author
-        article_author = soup.find("meta", property="article:author")
-        if article_author and article_author.get("content"):
-            author = self._get_clean_attr(article_author, "content")
-
-            if author:
-                return author
-
-        # Try common author patterns
-        author_tag = (
-            soup.find(class_="author")
-            or soup.find(class_="author-name")
-            or soup.find(itemprop="author")
-            or soup.find(rel="author")
-        )
-
-        if author_tag:
-            author_text = author_tag.get_text(strip=True)
-            if author_text:
-                return author_text
-
-        logger.debug("author_not_found", article_id=article_id)
-
-        return None
-
-    def _extract_published_date(self, soup: BeautifulSoup, article_id: str) -> str | None:
+        meta: dict[str, str] = {}
+
+        for tag in _RE_META_TAG.finditer(head):
+            attributes = {
+                match[1].lower(): match[2] or match[3] or match[4] or b""
+                for match in _RE_ATTRIBUTE.finditer(tag[0])
+            }
+            raw_key = attributes.get(b"property") or attributes.get(b"name") or b""
+            key = raw_key.decode(encoding, "replace").lower()
+
+            if key not in _META_KEYS or key in meta:
+                continue
+
+            content = attributes.get(b"content", b"").strip()
+            if content:
+                meta[key] = unescape(content.decode(encoding, "replace"))
+
+        return meta
+
+    def _first_match(
+        self,
+        root: html.HtmlElement | None,
+        meta: dict[str, str],
+        meta_keys: tuple[str, ...],
+        xpaths: tuple[etree.XPath, ...] = (),
+    ) -> str | None:
         """
-        Extract published date from HTML.
-
-        Tries:
-        1. <meta property="article:published_time">
-        2. <time> tag with datetime attribute
-        3. Common date class patterns
+        Resolve a field from meta tags first, then from document fallbacks.
 
         Args:
-            soup: BeautifulSoup parsed HTML
-            article_id: Article ID for logging
+            root: Parsed HTML document, or None if only the head was scanned
+            meta: Collected meta tag contents
+            meta_keys: Meta keys to try, in priority order
+            xpaths: Compiled string XPaths to try when no meta key matches
 
         Returns:
-            Published date string or None if not found
+            First non-empty value or None if nothing matched
         """
-        # Try article:published_time
-        published_time = soup.find("meta", property="article:published_time")
-        if published_time and published_time.get("content"):
-            time = self._get_clean_attr(published_time, "content")
-
-            if time:
-                return time
-
-        # Try time tag with datetime
-        time_tag = soup.find("time", attrs={"datetime": True})
-        if time_tag:
-            time = self._get_clean_attr(time_tag, "content")
-
-            if time:
-                return time
-
-        # Try common date patterns
-        date_tag = (
-            soup.find(class_="published")
-            or soup.find(class_="date")
-            or soup.find(class_="post-date")
-            or soup.find(itemprop="datePublished")
-        )
+        for key in meta_keys:
+            value = meta.get(key)
+            if value:
+                return value
 
-        if date_tag:
-            date_text = date_tag.get_text(strip=True)
-            if date_text:
-                return date_text
+        if root is None:
+            return None
 
-        logger.debug("published_date_not_found", article_id=article_id)
+        for xpath in xpaths:
+            value = xpath(root)
+            if value:
+                return str(value)
 
         return None
@@ -1,29 +1,52 @@
-import json
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import batched
 from pathlib import Path
+from typing import Any, BinaryIO
 
+import ijson
+import msgspec
+import orjson
 from redis import Redis, RedisError
 
 from shared.config import get_settings
 from shared.logger import configure_logging, get_logger
 from shared.models import ArticleTask
 
-logger = get_logger(__name__)
+# Named explicitly: worker processes re-import this module as __mp_main__
+logger = get_logger("publisher.main")
 
 
-def load_articles(file_path: Path) -> list[ArticleTask]:
+# Number of articles read, validated and pushed (by one variadic RPUSH) at a time
+CHUNK_SIZE = 1000
+
+# Redis client of a publisher worker process, created by _init_worker
+_worker_client: Redis | None = None
+
+
+def load_articles(file_path: Path) -> Iterator[list[dict[str, Any]]]:
     """
-    Load and validate articles from JSON file.
+    Stream and validate articles from JSON file in chunks.
+
+    The file is parsed incrementally with ijson, so memory use is bounded by
+    the chunk size rather than the file size. All articles are validated
+    against ``ArticleTask`` in a first streaming pass, before any chunk is
+    yielded, so invalid input never leaves a partial publish behind. Chunks
+    hold the raw dicts, which the publisher serializes as-is. With
+    ``trusted_input`` enabled, the validation pass is skipped.
 
     Args:
         file_path: Path to articles.json file
 
-    Returns:
-        List of validated ArticleTask objects
+    Yields:
+        Chunks of up to ``CHUNK_SIZE`` article dicts
 
     Raises:
         FileNotFoundError: If articles.json doesn't exist
-        JSONDecodeError: If JSON is malformed
-        ValidationError: If article data is invalid
+        KeyError: If the file has no top-level ``articles`` array
+        ijson.JSONError: If JSON is malformed
+        msgspec.ValidationError: If article data is invalid
     """
     logger.info("loading_articles", file_path=str(file_path))
 
@@ -31,15 +54,39 @@ def load_articles(file_path: Path) -> list[ArticleTask]:
         logger.error("file_not_found", file_path=str(file_path))
         raise FileNotFoundError(f"Articles file not found: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as file:
-        data = json.load(file)
+    count = 0
+
+    with open(file_path, "rb") as file:
+        if not get_settings().trusted_input:
+            # Validate each chunk using msgspec in one pass
+            for articles in _read_chunks(file):
+                msgspec.convert(articles, list[ArticleTask])
+
+        for articles in _read_chunks(file):
+            count += len(articles)
+            yield articles
+
+        if not count and not _has_articles_array(file):
+            raise KeyError("articles")
+
+    logger.info("articles_loaded", count=count)
 
-    # Validate each article using Pydantic
-    articles = [ArticleTask(**article) for article in data["articles"]]
 
-    logger.info("articles_loaded", count=len(articles))
+def _read_chunks(file: BinaryIO) -> Iterator[list[dict[str, Any]]]:
+    """Stream the articles array from the start of the file in chunks."""
+    file.seek(0)
 
-    return articles
+    for chunk in batched(ijson.items(file, "articles.item", use_float=True), CHUNK_SIZE):
+        yield list(chunk)
+
+
+def _has_articles_array(file: BinaryIO) -> bool:
+    """Check whether the JSON document has a top-level ``articles`` array."""
+    file.seek(0)
+
+    return any(
+        prefix == "articles" and event == "start_array" for prefix, event, _ in ijson.parse(file)
+    )
 
 
 def get_redis_client() -> Redis:
@@ -55,7 +102,9 @@ def get_redis_client() -> Redis:
         host=settings.redis_host,
         port=settings.redis_port,
         db=settings.redis_db,
-        decode_responses=True,
+        decode_responses=False,
+        socket_keepalive=True,
+        health_check_interval=30,
     )
 
     client.ping()
@@ -70,13 +119,16 @@ def get_redis_client() -> Redis:
     return client
 
 
-def publish_tasks(client: Redis, articles: list[ArticleTask]) -> int:
+def publish_tasks(client: Redis, batches: Iterable[list[dict[str, Any]]]) -> int:
     """
     Push article tasks to Redis queue.
 
+    Each batch is pushed with a single variadic RPUSH command as soon as it
+    is read, so only one batch is held in memory at a time.
+
     Args:
         client: Redis client connection
-        articles: List of article tasks to publish
+        batches: Batches of article dicts to publish
 
     Returns:
         Number of tasks published
@@ -84,23 +136,82 @@ def publish_tasks(client: Redis, articles: list[ArticleTask]) -> int:
     settings = get_settings()
     published_count = 0
 
-    for article in articles:
-        task_data = article.model_dump_json()
+    # Bind hot-loop lookups to locals once
+    queue = settings.queue_name
+    queue_key = settings.queue_name_bytes
+    # orjson serializes the raw dicts in C; a Python template encoder specialized
+    # to the task fields measured an order of magnitude slower
+    dumps = orjson.dumps
+    rpush = client.rpush
+    log_debug = logger.debug
+
+    # Per-article events are only rendered when DEBUG logging is enabled
+    debug = logger.is_enabled_for(logging.DEBUG)
+
+    for batch in batches:
+        # Append to queue (RPUSH adds to right/tail of list, in argument order)
+        rpush(queue_key, *[dumps(article) for article in batch])
+        published_count += len(batch)
+
+        if debug:
+            for article in batch:
+                log_debug(
+                    "task_published",
+                    article_id=article["id"],
+                    url=article["url"],
+                    priority=article["priority"],
+                    queue=queue,
+                )
+
+        logger.info("batch_published", count=len(batch), queue=queue)
+
+    return published_count
+
+
+def _init_worker() -> None:
+    """Set up logging and a dedicated Redis connection in a worker process."""
+    global _worker_client
 
-        # Push to queue (LPUSH adds to left/head of list)
-        client.lpush(settings.queue_name, task_data)
+    configure_logging()
+    _worker_client = get_redis_client()
+
+
+def _publish_batch(batch: list[dict[str, Any]]) -> int:
+    """Publish a single batch from a worker process."""
+    if _worker_client is None:
+        raise RuntimeError("publisher worker not initialized")
+
+    return publish_tasks(_worker_client, [batch])
+
+
+def publish_tasks_parallel(batches: Iterable[list[dict[str, Any]]], workers: int) -> int:
+    """
+    Push article tasks to Redis queue from a pool of worker processes.
+
+    Batches are serialized and pushed by the workers, each over its own Redis
+    connection. At most two batches per worker are in flight at a time, so
+    reading the file never runs far ahead of publishing.
+
+    Args:
+        batches: Batches of article dicts to publish
+        workers: Number of worker processes
 
-        logger.info(
-            "task_published",
-            article_id=article.id,
-            url=str(article.url),
-            priority=article.priority,
-            queue=settings.queue_name,
-        )
+    Returns:
+        Number of tasks published
+    """
+    published_count = 0
+    pending: set[Future[int]] = set()
 
-        published_count += 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for batch in batches:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                published_count += sum(future.result() for future in done)
 
-    logger.info("publishing_complete", total_published=published_count)
+            pending.add(executor.submit(_publish_batch, batch))
+
+        done, _ = wait(pending)
+        published_count += sum(future.result() for future in done)
 
     return published_count
 
@@ -110,22 +221,21 @@ def main() -> None:
     configure_logging()
     logger.info("publisher_starting")
 
+    settings = get_settings()
+
     try:
-        # Load articles from JSON
+        # Stream articles from JSON and publish them to the queue chunk by chunk
         articles_file = Path("data/articles.json")
-        articles = load_articles(articles_file)
-
-        # Connect to Redis
-        redis_client = get_redis_client()
+        batches = load_articles(articles_file)
 
-        # Publish tasks to queue
-        published_count = publish_tasks(redis_client, articles)
+        if settings.publisher_workers > 1:
+            published_count = publish_tasks_parallel(batches, settings.publisher_workers)
+        else:
+            # Connect to Redis
+            redis_client = get_redis_client()
+            published_count = publish_tasks(redis_client, batches)
 
-        logger.info(
-            "publisher_complete",
-            total_articles=len(articles),
-            published=published_count,
-        )
+        logger.info("publisher_complete", published=published_count)
 
     except FileNotFoundError as error:
         logger.error("file_error", error=str(error))
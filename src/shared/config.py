@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic import Field, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,30 +20,41 @@ class Settings(BaseSettings):
 
     # Application Settings
     log_level: str = Field(default="INFO")
+    verbose: bool = Field(default=False)
+    trusted_input: bool = Field(default=False)
+    publisher_workers: int = Field(default=1)
     max_retries: int = Field(default=3)
     retry_backoff_base: int = Field(default=1)
+    max_concurrency: int = Field(default=16)
+    batch_size: int = Field(default=16)
+
+    # MongoDB connection pool
+    mongo_pool_size: int = Field(default=16)
+
+    # MongoDB write batching
+    mongo_batch_size: int = Field(default=500)
+    mongo_flush_interval: float = Field(default=1.0)
 
     # Queue names
     queue_name: str = Field(default="article_queue")
     dlq_name: str = Field(default="article_queue:failed")
+    retry_queue_name: str = Field(default="article_queue:retry")
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
-
-# Singleton instance
-_settings: Settings | None = None
+    @cached_property
+    def queue_name_bytes(self) -> bytes:
+        """Queue name pre-encoded for clients created with ``decode_responses=False``."""
+        return self.queue_name.encode()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create the settings singleton instance."""
-    global _settings
-
-    if _settings is None:
-        _settings = Settings()
-
-    return _settings
+    return Settings()
@@ -1,25 +1,33 @@
-from pymongo import ASCENDING, MongoClient
+from functools import lru_cache
+
+from pymongo import ASCENDING, AsyncMongoClient, IndexModel
 from pymongo.errors import OperationFailure
+from pymongo.uri_parser import parse_uri
 
 from shared.config import get_settings
 from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Database used when the MongoDB URI does not name one
+DEFAULT_DATABASE_NAME = "article_pipeline"
+
 
+@lru_cache(maxsize=1)
 def get_database_name() -> str:
     """
     Extract database name from MongoDB URI.
 
+    The URI is parsed once with pymongo's own parser and the result cached.
+
     Returns:
         Database name
     """
     settings = get_settings()
-    db_name = settings.mongodb_uri.split("/")[-1].split("?")[0]
-    return db_name
+    return parse_uri(settings.mongodb_uri)["database"] or DEFAULT_DATABASE_NAME
 
 
-def ensure_indexes(client: MongoClient) -> None:
+async def ensure_indexes(client: AsyncMongoClient) -> None:
     """
     Ensure required indexes exist on the articles collection.
 
@@ -38,37 +46,24 @@ def ensure_indexes(client: MongoClient) -> None:
 
     logger.info("ensuring_mongodb_indexes", database=db_name)
 
-    try:
-        # Create unique index on URL to prevent duplicate URLs
-        collection.create_index(
-            [("url", ASCENDING)],
-            unique=True,
-            name="url_unique_index",
-        )
-        logger.info("index_ensured", index="url_unique_index", unique=True)
-
-        # Create index on status for efficient filtering
-        collection.create_index(
-            [("status", ASCENDING)],
-            name="status_index",
-        )
-        logger.info("index_ensured", index="status_index")
-
-        # Create index on scraped_at for time-based queries
-        collection.create_index(
-            [("scraped_at", ASCENDING)],
-            name="scraped_at_index",
-        )
-        logger.info("index_ensured", index="scraped_at_index")
-
-        # Create compound index for common queries (status + scraped_at)
-        collection.create_index(
+    indexes = [
+        # Unique index on URL to prevent duplicate URLs
+        IndexModel([("url", ASCENDING)], unique=True, name="url_unique_index"),
+        # Index on scraped_at for time-based queries
+        IndexModel([("scraped_at", ASCENDING)], name="scraped_at_index"),
+        # Compound index for common queries (status + scraped_at); its status
+        # prefix also serves status-only filters
+        IndexModel(
             [("status", ASCENDING), ("scraped_at", ASCENDING)],
             name="status_scraped_at_index",
-        )
-        logger.info("index_ensured", index="status_scraped_at_index")
+        ),
+    ]
+
+    try:
+        # Create all indexes with a single createIndexes command
+        names = await collection.create_indexes(indexes)
 
-        logger.info("mongodb_indexes_ready", collection="articles")
+        logger.info("mongodb_indexes_ready", collection="articles", indexes=names)
 
     except OperationFailure as error:
         logger.error("mongodb_index_creation_failed", error=str(error))
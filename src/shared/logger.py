@@ -1,40 +1,48 @@
 import logging
 import sys
 
+import orjson
 import structlog
-from structlog.stdlib import BoundLogger
+from structlog.typing import FilteringBoundLogger
 
 from shared.config import get_settings
 
 
 def configure_logging() -> None:
-    """Configure structlog for structured JSON logging."""
+    """
+    Configure structlog for structured JSON logging.
+
+    Events are rendered to bytes with orjson and written straight to stdout's
+    binary buffer, bypassing the standard library logging machinery. Level
+    filtering happens in the bound logger before any processor runs.
+    """
     settings = get_settings()
+    level = getattr(logging, settings.log_level.upper())
 
-    # Configure standard library logging
+    # Configure standard library logging for third-party libraries
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper()),
+        level=level,
     )
 
-    # Configure structlog processors
+    # Configure structlog processors. Events never carry stack_info or
+    # exc_info, so the stack and exception renderers are left out of the chain.
     structlog.configure(
         processors=[
-            structlog.stdlib.add_log_level,
+            structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso", utc=True),
             structlog.stdlib.add_logger_name,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> BoundLogger:
+def get_logger(name: str) -> FilteringBoundLogger:
     """
     Get a configured structlog logger instance.
 
@@ -1,53 +1,32 @@
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+import msgspec
 
 
-class ArticleTask(BaseModel):
-    """Represents an article task from the JSON input."""
+class ArticleTask(msgspec.Struct, frozen=True, omit_defaults=True):
+    """
+    Represents an article task from the JSON input.
 
-    id: str = Field(...)
-    url: HttpUrl = Field(...)
-    source: str = Field(...)
-    category: str = Field(...)
-    priority: Literal["high", "medium", "low"] = Field(...)
+    The publisher validates input articles against this struct and the
+    consumer decodes queue payloads straight into it, each in a single pass.
+    ``attempt`` is only present on payloads rescheduled through the retry set.
+    """
 
+    id: str
+    url: Annotated[str, msgspec.Meta(pattern=r"^https?://")]
+    source: str
+    category: str
+    priority: Literal["high", "medium", "low"]
+    attempt: int = 1
 
-class ScrapedContent(BaseModel):
+
+class ScrapedContent(msgspec.Struct, kw_only=True):
     """Represents the scraped content from an article."""
 
-    title: str = Field(...)
-    meta_description: str | None = Field(None)
-    author: str | None = Field(None)
-    published_date: str | None = Field(None)
-    http_status: int = Field(...)
-    scraped_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-
-class ArticleDocument(BaseModel):
-    """Complete article document stored in MongoDB."""
-
-    # Original task fields
-    id: str = Field(..., alias="_id")
-    url: str = Field(...)
-    source: str = Field(...)
-    category: str = Field(...)
-    priority: Literal["high", "medium", "low"] = Field(...)
-
-    # Scraped content
-    title: str | None = Field(None)
-    meta_description: str | None = Field(None)
-    author: str | None = Field(None)
-    published_date: str | None = Field(None)
-    http_status: int | None = Field(None)
-
-    # Metadata
-    scraped_at: datetime | None = Field(None)
-    status: Literal["pending", "success", "failed"] = Field(default="pending")
-    attempts: int = Field(default=0)
-    error_message: str | None = Field(None)
-
-    class Config:
-        # Allow using _id as alias
-        populate_by_name = True
+    title: str
+    meta_description: str | None = None
+    author: str | None = None
+    published_date: str | None = None
+    http_status: int
+    scraped_at: datetime = msgspec.field(default_factory=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,67 @@
+import unittest
+
+import httpx
+
+from consumer.scraper import ArticleScraper
+
+
+def _serve(body: bytes, content_type: str) -> httpx.MockTransport:
+    """Build a transport answering every request with the given HTML body."""
+    return httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"Content-Type": content_type}, content=body)
+    )
+
+
+class ScraperEncodingTest(unittest.IsolatedAsyncioTestCase):
+    """Non-ASCII text must be decoded with the charset the page declares."""
+
+    async def scrape_title(self, body: bytes, content_type: str) -> str:
+        scraper = ArticleScraper()
+        await scraper.close()
+        scraper._client = httpx.AsyncClient(transport=_serve(body, content_type))
+
+        try:
+            content = await scraper.scrape("http://example.test/article", "test")
+        finally:
+            await scraper.close()
+
+        return content.title
+
+    async def test_charset_from_header(self) -> None:
+        body = "<html><head></head><body><h1>Hello World ü</h1></body></html>".encode()
+        title = await self.scrape_title(body, "text/html; charset=utf-8")
+
+        self.assertEqual(title, "Hello World ü")
+
+    async def test_charset_from_meta_tag(self) -> None:
+        body = (
+            '<html><head><meta charset="windows-1252"></head>'
+            "<body><h1>Café – naïve</h1></body></html>"
+        ).encode("cp1252")
+        title = await self.scrape_title(body, "text/html")
+
+        self.assertEqual(title, "Café – naïve")
+
+    async def test_head_meta_uses_declared_charset(self) -> None:
+        # Every field is covered by head meta tags, so only the regex head scan runs
+        body = (
+            '<html><head><meta charset="iso-8859-1">'
+            '<meta property="og:title" content="Grüße aus Köln">'
+            '<meta name="description" content="Ä">'
+            '<meta name="author" content="Jürgen">'
+            '<meta property="article:published_time" content="2024-01-01">'
+            "</head><body><h1>Ignored</h1></body></html>"
+        ).encode("latin-1")
+        title = await self.scrape_title(body, "text/html")
+
+        self.assertEqual(title, "Grüße aus Köln")
+
+    async def test_utf8_by_default(self) -> None:
+        body = "<html><head></head><body><h1>Überschrift</h1></body></html>".encode()
+        title = await self.scrape_title(body, "text/html")
+
+        self.assertEqual(title, "Überschrift")
+
+
+if __name__ == "__main__":
+    unittest.main()